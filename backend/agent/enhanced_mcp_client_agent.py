@@ -22,8 +22,25 @@ from streaming_parser import (
 # Built-in tools
 from tools import get_image_src, get_images
 
+from utils.openai_clients import get_async_openai_client
+
 logger = logging.getLogger(__name__)
 
+# {VAR_NAME} placeholders in MCP server URLs and headers
+_ENV_VAR_PATTERN = re.compile(r'\{([A-Z_][A-Z0-9_]*)\}')
+
+class ToolWrapper:
+    """Tool object that mimics the interface expected by LangChain-style consumers."""
+    
+    def __init__(self, name, description, input_schema, call_func):
+        self.name = name
+        self.description = description
+        self.inputSchema = input_schema
+        self._call_func = call_func
+    
+    async def call(self, arguments):
+        return await self._call_func(arguments)
+
 @dataclass
 class MCPServerConfig:
     name: str
@@ -43,12 +60,19 @@ class MCPClientConfig:
 class EnhancedMCPClient:
     """Enhanced MCP client that supports HTTP servers and external configuration."""
     
-    def __init__(self, config_path: str, max_tool_calls: int = 10):
+    def __init__(self, config_path: Optional[str] = None, max_tool_calls: int = 10,
+                 config_data: Optional[Dict[str, Any]] = None):
         self.config_path = config_path
+        # Already-parsed configuration; takes precedence over config_path when given
+        self.config_data = config_data
         self.config: Optional[MCPClientConfig] = None
         self.openai_client: Optional[AsyncOpenAI] = None
         self.sessions: Dict[str, ClientSession] = {}
         self.available_tools: Dict[str, Any] = {}
+        # (tool keys, system prompt, function definitions) for enhancement decisions
+        self._enhancement_setup: Optional[Tuple[tuple, str, List[Dict[str, Any]]]] = None
+        # (tool keys, wrappers) returned by get_tools()
+        self._tool_wrappers: Optional[Tuple[tuple, List[ToolWrapper]]] = None
         # Store connection resources for proper cleanup
         self._connection_resources: Dict[str, Tuple[Any, Any, Any]] = {}
         # Maximum number of tool calls allowed per enhancement decision
@@ -64,7 +88,7 @@ class EnhancedMCPClient:
             self.config = await self._load_config()
             
             # Initialize OpenAI client
-            self.openai_client = AsyncOpenAI(api_key=self.config.openai_api_key)
+            self.openai_client = get_async_openai_client(self.config.openai_api_key)
             
             # Connect to all MCP servers
             await self._connect_to_servers()
@@ -76,10 +100,13 @@ class EnhancedMCPClient:
             raise
     
     async def _load_config(self) -> MCPClientConfig:
-        """Load configuration from JSON file."""
+        """Load configuration from the in-memory config data or the JSON file."""
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
+            if self.config_data is not None:
+                data = self.config_data
+            else:
+                with open(self.config_path, 'r') as f:
+                    data = json.load(f)
             
             config_section = data.get('config', {})
             servers_section = data.get('servers', {})
@@ -124,6 +151,10 @@ class EnhancedMCPClient:
     
     def _substitute_env_vars(self, text: str) -> str:
         """Substitute environment variables in text using {VAR_NAME} format."""
+        # Most URLs and headers carry no placeholders; skip the regex pass for them
+        if '{' not in text:
+            return text
+        
         def replace_var(match):
             var_name = match.group(1)
             env_value = os.getenv(var_name)
@@ -133,7 +164,7 @@ class EnhancedMCPClient:
             return env_value
         
         # Replace {VAR_NAME} with environment variable values
-        return re.sub(r'\{([A-Z_][A-Z0-9_]*)\}', replace_var, text)
+        return _ENV_VAR_PATTERN.sub(replace_var, text)
     
     def _add_builtin_tools(self):
         """Add built-in Python tools to the available tools."""
@@ -511,21 +542,18 @@ class EnhancedMCPClient:
         return list(self.available_tools.keys())
     
     def get_tools(self) -> List[Any]:
-        """Get tools in the format expected by LangGraph/LangChain integration."""
+        """
+        Get tools in the format expected by LangGraph/LangChain integration.
+        
+        The wrappers are built once and reused until the set of available tools changes.
+        """
+        tools_signature = tuple(self.available_tools)
+        if self._tool_wrappers is not None and self._tool_wrappers[0] == tools_signature:
+            return self._tool_wrappers[1]
+        
         tools = []
         for tool_key, tool_info in self.available_tools.items():
             tool = tool_info['tool']
-            # Create a tool object that mimics the expected interface
-            class ToolWrapper:
-                def __init__(self, name, description, input_schema, call_func):
-                    self.name = name
-                    self.description = description
-                    self.inputSchema = input_schema
-                    self._call_func = call_func
-                
-                async def call(self, arguments):
-                    return await self._call_func(arguments)
-            
             wrapped_tool = ToolWrapper(
                 name=tool_key,
                 description=tool.description or f"Tool from {tool_info['server']}",
@@ -533,6 +561,8 @@ class EnhancedMCPClient:
                 call_func=lambda args, tk=tool_key: self._call_tool(tk, args)
             )
             tools.append(wrapped_tool)
+        
+        self._tool_wrappers = (tools_signature, tools)
         return tools
         
     async def close(self):
@@ -557,6 +587,89 @@ class EnhancedMCPClient:
         self.available_tools.clear()
         self._connection_resources.clear()
 
+    def _get_enhancement_setup(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Get the system prompt and function definitions for enhancement decisions.
+        
+        Both depend only on the prompt file and the available tools, which don't change
+        between decisions, so they are built once and reused until the tool set changes.
+        
+        Returns:
+            Tuple of (formatted system prompt, function definitions)
+        """
+        tools_signature = tuple(self.available_tools)
+        if self._enhancement_setup is not None and self._enhancement_setup[0] == tools_signature:
+            return self._enhancement_setup[1], self._enhancement_setup[2]
+        
+        # Load the enhancement prompt
+        prompt_path = os.path.join(os.path.dirname(__file__), "../prompts", "mcp_agent_prompt.txt")
+        with open(prompt_path, "r") as f:
+            enhancement_prompt = f.read().strip()
+            
+        # Get available tools information
+        available_tools_info = []
+        for tool_key, tool_info in self.available_tools.items():
+            tool = tool_info['tool']
+            available_tools_info.append({
+                "name": tool_key,
+                "description": tool.description or f"Tool from {tool_info['server']}",
+                "server": tool_info['server'],
+                "headers": tool_info.get("headers")
+            })
+        
+        # Format the prompt with available tools
+        tools_description = "\n".join([
+            f"- **{tool['name']}** ({tool['server']}): {tool['description']}" +
+            (f" (Headers sent: {json.dumps(tool['headers'])})" if tool.get('headers') else "")
+            for tool in available_tools_info
+        ])
+        
+        if not tools_description:
+            tools_description = "No tools currently available."
+        
+        formatted_prompt = enhancement_prompt.format(available_tools=tools_description)
+        
+        # Prepare function definitions from available tools
+        functions = []
+        for tool_key, tool_info in self.available_tools.items():
+            tool = tool_info['tool']
+            description = tool.description or f"Tool from {tool_info['server']}"
+            if tool_info.get("headers"):
+                description += f" Note: The following headers are sent with this tool call: {json.dumps(tool_info['headers'])}"
+            
+            functions.append({
+                "name": tool_key,
+                "description": description,
+                "parameters": tool.inputSchema
+            })
+        
+        # Add the synthetic enhancement decision function
+        functions.append({
+            "name": "process_enhancement_decision",
+            "description": "Process and return the final enhancement decision for the voice assistant response. Call this after using any tools or to provide the final decision.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "displayEnhancement": {
+                        "type": "boolean",
+                        "description": "Whether to display visual enhancement to the user"
+                    },
+                    "displayEnhancedText": {
+                        "type": "string", 
+                        "description": "The enhanced text to display to the user (can include tool results, formatting, etc.)"
+                    },
+                    "voiceOverText": {
+                        "type": "string",
+                        "description": "Text for voice-over narration (empty string if no enhancement)"
+                    }
+                },
+                "required": ["displayEnhancement", "displayEnhancedText", "voiceOverText"]
+            }
+        })
+        
+        self._enhancement_setup = (tools_signature, formatted_prompt, functions)
+        return formatted_prompt, functions
+    
     async def make_enhancement_decision_streaming(
         self,
         assistant_response: str,
@@ -572,33 +685,7 @@ class EnhancedMCPClient:
             raise RuntimeError("MCP client not initialized")
 
         try:
-            # Load the enhancement prompt
-            prompt_path = os.path.join(os.path.dirname(__file__), "../prompts", "mcp_agent_prompt.txt")
-            with open(prompt_path, "r") as f:
-                enhancement_prompt = f.read().strip()
-                
-            # Get available tools information
-            available_tools_info = []
-            for tool_key, tool_info in self.available_tools.items():
-                tool = tool_info['tool']
-                available_tools_info.append({
-                    "name": tool_key,
-                    "description": tool.description or f"Tool from {tool_info['server']}",
-                    "server": tool_info['server'],
-                    "headers": tool_info.get("headers")
-                })
-            
-            # Format the prompt with available tools
-            tools_description = "\n".join([
-                f"- **{tool['name']}** ({tool['server']}): {tool['description']}" +
-                (f" (Headers sent: {json.dumps(tool['headers'])})" if tool.get('headers') else "")
-                for tool in available_tools_info
-            ])
-            
-            if not tools_description:
-                tools_description = "No tools currently available."
-            
-            formatted_prompt = enhancement_prompt.format(available_tools=tools_description)
+            formatted_prompt, functions = self._get_enhancement_setup()
             
             # Prepare conversation context
             context_text = ""
@@ -622,44 +709,6 @@ Instructions:
 3. Always end by calling process_enhancement_decision - this is required to complete the task"""}
             ]
             
-            # Prepare function definitions from available tools
-            functions = []
-            for tool_key, tool_info in self.available_tools.items():
-                tool = tool_info['tool']
-                description = tool.description or f"Tool from {tool_info['server']}"
-                if tool_info.get("headers"):
-                    description += f" Note: The following headers are sent with this tool call: {json.dumps(tool_info['headers'])}"
-                
-                functions.append({
-                    "name": tool_key,
-                    "description": description,
-                    "parameters": tool.inputSchema
-                })
-            
-            # Add the synthetic enhancement decision function
-            functions.append({
-                "name": "process_enhancement_decision",
-                "description": "Process and return the final enhancement decision for the voice assistant response. Call this after using any tools or to provide the final decision.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "displayEnhancement": {
-                            "type": "boolean",
-                            "description": "Whether to display visual enhancement to the user"
-                        },
-                        "displayEnhancedText": {
-                            "type": "string", 
-                            "description": "The enhanced text to display to the user (can include tool results, formatting, etc.)"
-                        },
-                        "voiceOverText": {
-                            "type": "string",
-                            "description": "Text for voice-over narration (empty string if no enhancement)"
-                        }
-                    },
-                    "required": ["displayEnhancement", "displayEnhancedText", "voiceOverText"]
-                }
-            })
-            
             # Process function calls in a loop until we get the final decision
             tools_used = []
             max_iterations = 5  # Prevent infinite loops
@@ -2,6 +2,8 @@ import enum
 import os
 import sys
 import asyncio
+import functools
+import time
 from typing import Any
 import uuid
 
@@ -11,7 +13,7 @@ from dotenv import load_dotenv
 from loguru import logger
 
 from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.frames.frames import Frame, InputImageRawFrame, OutputImageRawFrame, LLMTextFrame, TTSTextFrame, LLMFullResponseEndFrame, TranscriptionFrame
+from pipecat.frames.frames import Frame, InputImageRawFrame, OutputImageRawFrame, LLMTextFrame, TTSTextFrame, LLMFullResponseEndFrame, TranscriptionFrame, StartInterruptionFrame, SystemFrame
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
@@ -43,8 +45,22 @@ from app.queues import (
 
 load_dotenv(override=True)
 
+# LLM tokens are coalesced into one TTSTextFrame once this many characters are
+# pending, or once this many seconds have passed since the last flush
+TTS_FLUSH_CHARS = 48
+TTS_FLUSH_INTERVAL = 0.05
+
+# Upper bound on the assistant response kept for chat history, in characters
+MAX_RESPONSE_CHARS = 65536
+
+@functools.lru_cache(maxsize=1)
 def load_voice_agent_prompt() -> str:
-    """Load the voice agent system prompt from the prompts directory and inject available tools."""
+    """
+    Load the voice agent system prompt from the prompts directory and inject available tools.
+    
+    The prompt only depends on files and environment read at startup, so it is built
+    once per process instead of on every WebRTC connection.
+    """
     prompt_path = os.path.join(os.path.dirname(__file__), "..", "..", "prompts", "voice_agent_system.txt")
     mcp_config_path = os.path.join(os.path.dirname(__file__), "..", "..", "mcp_servers.json")
     
@@ -255,7 +271,7 @@ class VoiceInterfaceAgent:
         response_aggregator = ResponseAggregatorProcessor(context, self)
             
 
-        # Build the pipeline with XmlSplitProcessor after the LLM service
+        # Build the pipeline with the response aggregator after the LLM service
         pipeline = Pipeline(
             [
                 pipecat_transport.input(),
@@ -327,7 +343,22 @@ class ResponseAggregatorProcessor(FrameProcessor):
         super().__init__()
         self.context = context
         self.agent_instance = agent_instance
-        self.current_assistant_response_buffer = ""
+        # Text chunks of the in-progress response, joined once at LLMFullResponseEndFrame
+        self.current_assistant_response_chunks = []
+        self._response_chars = 0
+        # Text not yet pushed to TTS
+        self._pending_tts = []
+        self._pending_tts_len = 0
+        self._last_tts_flush = time.monotonic()
+
+    async def _flush_tts(self, direction: FrameDirection):
+        """Push any pending text to TTS as a single TTSTextFrame."""
+        if self._pending_tts:
+            text = "".join(self._pending_tts)
+            self._pending_tts.clear()
+            self._pending_tts_len = 0
+            await self.push_frame(TTSTextFrame(text=text), direction)
+        self._last_tts_flush = time.monotonic()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
@@ -336,15 +367,37 @@ class ResponseAggregatorProcessor(FrameProcessor):
         # This ensures other frames (like LLMTextEndFrame, etc.) are passed if not explicitly handled.
 
         if isinstance(frame, LLMTextFrame):
-            self.current_assistant_response_buffer += frame.text
-            # Push TTSTextFrame for TTS service to speak out the text chunk by chunk
-            await self.push_frame(TTSTextFrame(text=frame.text), direction)
+            if self._response_chars < MAX_RESPONSE_CHARS:
+                self.current_assistant_response_chunks.append(frame.text)
+                self._response_chars += len(frame.text)
+                if self._response_chars >= MAX_RESPONSE_CHARS:
+                    logger.warning(f"Assistant response exceeded {MAX_RESPONSE_CHARS} chars; "
+                                   f"truncating the copy kept for chat history")
+            # Batch tokens into larger TTSTextFrames so TTS sees fewer, bigger chunks
+            self._pending_tts.append(frame.text)
+            self._pending_tts_len += len(frame.text)
+            if (self._pending_tts_len >= TTS_FLUSH_CHARS
+                    or time.monotonic() - self._last_tts_flush >= TTS_FLUSH_INTERVAL):
+                await self._flush_tts(direction)
             return  # LLMTextFrame is consumed here and converted to TTSTextFrame
 
+        if isinstance(frame, StartInterruptionFrame):
+            # The user barged in; unspoken text must not reach TTS
+            self._pending_tts.clear()
+            self._pending_tts_len = 0
+            await self.push_frame(frame, direction)
+            return
+
+        if (self._pending_tts
+                and direction == FrameDirection.DOWNSTREAM
+                and not isinstance(frame, SystemFrame)):
+            # Keep pending text ahead of data/control frames that follow it downstream
+            await self._flush_tts(direction)
+
         if isinstance(frame, LLMFullResponseEndFrame):
-            if self.current_assistant_response_buffer:
+            if self.current_assistant_response_chunks:
                 # Add the complete assistant response to chat history
-                assistant_response = self.current_assistant_response_buffer.strip()
+                assistant_response = "".join(self.current_assistant_response_chunks).strip()
                 await chat_history_manager.add_assistant_message(
                     self.agent_instance.thread_id,
                     assistant_response
@@ -388,7 +441,8 @@ class ResponseAggregatorProcessor(FrameProcessor):
                 )
                 
                 # Reset buffer after processing the full response
-                self.current_assistant_response_buffer = ""
+                self.current_assistant_response_chunks.clear()
+                self._response_chars = 0
             
             # Pass the LLMFullResponseEndFrame itself downstream
             await self.push_frame(frame, direction)
@@ -9,7 +9,9 @@ conversation history per thread_id across different interaction types
 import asyncio
 import logging
 import time
-from typing import Dict, List, Any, Optional, Union
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Any, Optional, Union
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -22,7 +24,7 @@ class ChatHistoryManager:
     - Stores messages in OpenAI format (role/content) per thread_id
     - Handles different message sources (text, voice, C1 components)
     - Provides methods to add, retrieve, and clear history
-    - Manages context window by limiting history size when needed
+    - Bounds each thread's history to a sliding window of recent messages
     """
     
     def __init__(self, max_history_per_thread: int = 50, max_inactive_time: int = 3600):
@@ -33,8 +35,10 @@ class ChatHistoryManager:
             max_history_per_thread: Maximum number of messages to store per thread
             max_inactive_time: Maximum time (in seconds) to keep inactive threads
         """
-        # Main storage: thread_id -> list of messages
-        self._history: Dict[str, List[Dict[str, Any]]] = {}
+        # Main storage: thread_id -> bounded window of messages. The deque's maxlen
+        # drops the oldest message on append, so a thread never holds more than
+        # max_history_per_thread entries and trimming never copies the history.
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
         
         # Thread metadata: thread_id -> last_activity_timestamp
         self._thread_metadata: Dict[str, Dict[str, Any]] = {}
@@ -76,9 +80,6 @@ class ChatHistoryManager:
             # Update thread metadata
             self._update_thread_activity(thread_id)
             
-            # Trim history if needed
-            self._trim_history_if_needed(thread_id)
-            
             logger.debug(f"Added user message to thread {thread_id}: {message[:50]}...")
     
     async def add_assistant_message(self, thread_id: str, message: str, message_id: Optional[str] = None) -> None:
@@ -109,9 +110,6 @@ class ChatHistoryManager:
             # Update thread metadata
             self._update_thread_activity(thread_id)
             
-            # Trim history if needed
-            self._trim_history_if_needed(thread_id)
-            
             logger.debug(f"Added assistant message to thread {thread_id}: {message[:50]}...")
     
     async def add_function_message(self, thread_id: str, function_name: str, content: str) -> None:
@@ -139,9 +137,6 @@ class ChatHistoryManager:
             # Update thread metadata
             self._update_thread_activity(thread_id)
             
-            # Trim history if needed
-            self._trim_history_if_needed(thread_id)
-            
             logger.debug(f"Added function message to thread {thread_id} for function {function_name}: {content[:50]}...")
     
     async def add_function_call(self, thread_id: str, function_name: str, arguments: Dict[str, Any]) -> None:
@@ -174,9 +169,6 @@ class ChatHistoryManager:
             # Update thread metadata
             self._update_thread_activity(thread_id)
             
-            # Trim history if needed
-            self._trim_history_if_needed(thread_id)
-            
             logger.debug(f"Added function call to thread {thread_id} for function {function_name}")
     
     async def add_system_message(self, thread_id: str, message: str) -> None:
@@ -202,9 +194,6 @@ class ChatHistoryManager:
             # Update thread metadata
             self._update_thread_activity(thread_id)
             
-            # Trim history if needed
-            self._trim_history_if_needed(thread_id)
-            
             logger.debug(f"Added system message to thread {thread_id}: {message[:50]}...")
     
     async def add_c1_action(self, thread_id: str, action_message: str) -> None:
@@ -233,7 +222,7 @@ class ChatHistoryManager:
             await self._ensure_thread_exists(thread_id)
             
             # Return a copy of the history to prevent external modification
-            history = self._history[thread_id].copy()
+            history = list(self._history[thread_id])
             
             logger.debug(f"Retrieved history for thread {thread_id}: {len(history)} messages")
             return history
@@ -255,8 +244,12 @@ class ChatHistoryManager:
             # Use provided max_messages or class default
             limit = max_messages if max_messages is not None else self.max_history_per_thread
             
-            # Get the most recent messages
-            history = self._history[thread_id][-limit:].copy()
+            # Get the most recent messages without copying the whole window first
+            thread_history = self._history[thread_id]
+            if 0 < limit < len(thread_history):
+                history = list(islice(thread_history, len(thread_history) - limit, None))
+            else:
+                history = list(thread_history)
             
             logger.debug(f"Retrieved {len(history)} recent messages for thread {thread_id}")
             return history
@@ -270,7 +263,7 @@ class ChatHistoryManager:
         """
         async with self._lock:
             if thread_id in self._history:
-                self._history[thread_id] = []
+                self._history[thread_id].clear()
                 
                 # Update thread metadata
                 self._update_thread_activity(thread_id)
@@ -372,7 +365,7 @@ class ChatHistoryManager:
             thread_id: The thread identifier
         """
         if thread_id not in self._history:
-            self._history[thread_id] = []
+            self._history[thread_id] = deque(maxlen=self.max_history_per_thread)
             
             # Initialize thread metadata
             current_time = time.time()
@@ -399,21 +392,6 @@ class ChatHistoryManager:
                 'created_at': current_time,
                 'last_activity': current_time
             }
-    
-    def _trim_history_if_needed(self, thread_id: str) -> None:
-        """
-        Trim the history if it exceeds the maximum allowed size.
-        
-        Args:
-            thread_id: The thread identifier
-        """
-        if thread_id in self._history:
-            history = self._history[thread_id]
-            if len(history) > self.max_history_per_thread:
-                # Keep the most recent messages
-                excess = len(history) - self.max_history_per_thread
-                self._history[thread_id] = history[excess:]
-                logger.debug(f"Trimmed {excess} old messages from thread {thread_id}")
 
 # Create a singleton instance
 chat_history_manager = ChatHistoryManager()
@@ -26,13 +26,11 @@ BASE_DIR = Path(__file__).parent.parent
 # --------------------------------------------------------------------------- #
 load_dotenv(dotenv_path=BASE_DIR / ".env", override=False)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Set once the root logger has been configured from LoggingSettings
+_logging_configured = False
+
 
 # --------------------------------------------------------------------------- #
 # Common settings base – allows unknown env vars so legacy keys don't break  #
@@ -84,6 +82,11 @@ class WebRTCSettings(SettingsBase):
         default=[{"urls": "stun:stun.l.google.com:19302"}],
         description="ICE servers for WebRTC connections"
     )
+    enable_prebuilt_ui: bool = Field(
+        default=False,
+        alias="ENABLE_WEBRTC_UI",
+        description="Serve the pipecat prebuilt WebRTC test UI at /prebuilt"
+    )
     
 class MCPSettings(SettingsBase):
     """MCP server configurations"""
@@ -153,9 +156,36 @@ class AppConfig:
     streaming: "StreamingSettings"  # quotes for forward reference
 
 
+def configure_logging(logging_settings: "LoggingSettings") -> None:
+    """
+    Configure the root logger from LoggingSettings, once per process.
+    
+    Replaces any bootstrap handler (e.g. the one main.py installs before the
+    configuration is loaded) so LOG_LEVEL and LOG_FORMAT always take effect, and
+    never attaches a second handler when called again.
+    
+    Args:
+        logging_settings: Logging configuration to apply
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    
+    logging.basicConfig(
+        level=getattr(logging, logging_settings.log_level.upper(), logging.INFO),
+        format=logging_settings.log_format,
+        force=True
+    )
+    _logging_configured = True
+
+
 def load_config() -> AppConfig:
     """Load and return the application configuration"""
     try:
+        # Configure logging first so the messages below use the configured level
+        logging_settings = LoggingSettings()
+        configure_logging(logging_settings)
+        
         logger.info("Loading application configuration...")
         
         # Load all configuration components
@@ -167,15 +197,8 @@ def load_config() -> AppConfig:
         thesys_settings = ThesysSettings()
         fastapi_settings = FastAPISettings()
         queue_settings = QueueSettings()
-        logging_settings = LoggingSettings()
         streaming_settings = StreamingSettings()
         
-        # Configure logging based on settings
-        logging.basicConfig(
-            level=getattr(logging, logging_settings.log_level),
-            format=logging_settings.log_format
-        )
-        
         # Validate critical settings
         if not api_settings.openai_api_key:
             logger.warning("OPENAI_API_KEY not set. Some features may not work.")
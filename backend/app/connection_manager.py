@@ -7,12 +7,10 @@ WebSocket connections.
 """
 
 import os
-import json
 import time
 import uuid
 import asyncio
 import logging
-import tempfile
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
@@ -41,7 +39,6 @@ class ConnectionContext:
     message_queue: Optional[asyncio.Queue] = None
     raw_output_queue: Optional[asyncio.Queue] = None
     processor_task: Optional[asyncio.Task] = None
-    temp_mcp_config_path: Optional[str] = None
     created_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
     metrics: ConnectionMetrics = field(init=False)
@@ -322,7 +319,8 @@ class ConnectionManager:
             30
         )
         
-        # Create temporary config file for this connection
+        # Build the config for this connection; it is handed to the client as a dict
+        # rather than round-tripped through a temporary JSON file
         config_data = {
             "config": {
                 "model": mcp_config.model,
@@ -340,21 +338,6 @@ class ConnectionManager:
             if server.headers:
                 config_data["servers"][server.name]["headers"] = server.headers
         
-        # Write to temporary file
-        temp_file = tempfile.NamedTemporaryFile(
-            mode='w', 
-            suffix=f'_mcp_config_{connection_id}.json',
-            delete=False
-        )
-        
-        with temp_file as f:
-            json.dump(config_data, f, indent=2)
-            temp_path = f.name
-        
-        # Store temp path for cleanup
-        context = self.connections[connection_id]
-        context.temp_mcp_config_path = temp_path
-        
         await self.update_state(
             connection_id, 
             ConnectionState.MCP_INITIALIZING,
@@ -363,7 +346,7 @@ class ConnectionManager:
         )
         
         try:
-            client = EnhancedMCPClient(temp_path, max_tool_calls=mcp_config.max_tool_calls)
+            client = EnhancedMCPClient(config_data=config_data, max_tool_calls=mcp_config.max_tool_calls)
             await asyncio.wait_for(client.initialize(), timeout=mcp_config.timeout)
             
             await self.update_state(
@@ -476,13 +459,6 @@ class ConnectionManager:
             except Exception as e:
                 logger.error(f"Error cleaning up viz provider for {connection_id}: {e}")
         
-        # Remove temporary MCP config file
-        if context.temp_mcp_config_path and os.path.exists(context.temp_mcp_config_path):
-            try:
-                os.unlink(context.temp_mcp_config_path)
-            except Exception as e:
-                logger.error(f"Error removing temp config file: {e}")
-        
         # Clear queues
         for queue in [context.message_queue, context.raw_output_queue]:
             if queue:
@@ -6,7 +6,6 @@ handling MCP client interactions and visualization provider streaming.
 """
 
 import asyncio
-import json
 import logging
 import uuid
 from typing import Dict, List, Any, Optional
@@ -15,7 +14,7 @@ from app.models import ConnectionState
 from app.queues import (
     create_text_chat_response, create_c1_token, create_html_token, create_chat_done,
     create_enhancement_started, get_content_type_for_provider, create_voice_response,
-    broadcast_voice_message
+    broadcast_voice_message, create_simple_card_content, create_error_callout_content
 )
 from utils.html_templates import create_simple_message_html, create_error_message_html, escape_html, ensure_html_wrapped
 from schemas import EnhancementDecision
@@ -31,11 +30,14 @@ async def send_message_to_frontend(message: dict, connection_context, source: st
     if message.get('type') in ['voice_response', 'immediate_voice_response', 'user_transcription']:
         # Broadcast voice messages to all relevant connections
         delivery_count = await broadcast_voice_message(message)
-        logger.info(f"Broadcasted {message.get('type')} to {delivery_count} subscribers (source: {source})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Broadcasted {message.get('type')} to {delivery_count} subscribers (source: {source})")
     else:
         # Use per-connection queue for non-voice messages
         await connection_context.message_queue.put(message)
-        logger.info(f"Enqueued {message.get('type')} to per-connection queue (source: {source})")
+        # Runs for every streamed c1_token; keep it out of INFO
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Enqueued {message.get('type')} to per-connection queue (source: {source})")
 
 class PerConnectionProcessor:
     """
@@ -47,6 +49,8 @@ class PerConnectionProcessor:
         self.context = context
         self.connection_id = context.connection_id
         self.running = False
+        # (base prompt, tool names) -> system prompt with the MCP tools section appended
+        self._system_prompt_cache: Dict[tuple, str] = {}
         
     async def run(self):
         """Main processing loop for this connection"""
@@ -277,7 +281,13 @@ class PerConnectionProcessor:
         if self.context.mcp_client:
             mcp_tools = self.context.mcp_client.get_tools()
         
-        system_prompt = create_enhanced_system_prompt(base_prompt, mcp_tools)
+        # The base prompt and tool set rarely change within a connection, so build the
+        # combined prompt once per combination
+        cache_key = (base_prompt, tuple(tool.name for tool in mcp_tools))
+        system_prompt = self._system_prompt_cache.get(cache_key)
+        if system_prompt is None:
+            system_prompt = create_enhanced_system_prompt(base_prompt, mcp_tools)
+            self._system_prompt_cache[cache_key] = system_prompt
         
         # Build message chain
         messages = [{"role": "system", "content": system_prompt}]
@@ -304,6 +314,8 @@ class PerConnectionProcessor:
         metadata: Optional[Dict[str, Any]] = None
     ):
         """Stream visualization response to frontend"""
+        enhanced_message_id = message_id
+        c1_stream_open = False
         try:
             # For voice-agent sources, generate a new message ID for the enhanced response
             source = metadata.get("source", "text_chat") if metadata else "text_chat"
@@ -319,14 +331,13 @@ class PerConnectionProcessor:
             provider_type = self.context.visualization_provider.provider_type.lower()
             content_type = get_content_type_for_provider(provider_type)
             
-            # Collect all chunks first
-            async for chunk in self.context.visualization_provider.stream_response(messages):
-                chunk_count += 1
-                full_content.append(chunk)
-            
             # Handle based on content type
             if content_type == "html":
                 # For HTML providers, send complete content in one message (no streaming)
+                async for chunk in self.context.visualization_provider.stream_response(messages):
+                    chunk_count += 1
+                    full_content.append(chunk)
+                
                 if full_content:
                     # Determine framework
                     framework = "tailwind"  # Default framework
@@ -359,14 +370,16 @@ class PerConnectionProcessor:
                     
                     await self._send_to_frontend(response_msg)
             else:
-                # For C1 providers, continue streaming as before
-                for chunk in full_content:
+                # For C1 providers, forward each chunk as soon as the provider yields it
+                # so the UI starts rendering on the first token, not the last
+                async for chunk in self.context.visualization_provider.stream_response(messages):
+                    chunk_count += 1
                     chunk_msg = create_c1_token(id=enhanced_message_id, content=chunk)
                     await self._send_to_frontend(chunk_msg)
-                    # Small delay for smooth streaming
-                    await asyncio.sleep(0.01)
+                    c1_stream_open = True
                 
                 # Send completion signal for C1 streaming
+                c1_stream_open = False
                 done_msg = create_chat_done(id=enhanced_message_id)
                 await self._send_to_frontend(done_msg)
             
@@ -374,6 +387,10 @@ class PerConnectionProcessor:
             
         except Exception as e:
             logger.error(f"Visualization streaming failed for {self.connection_id}: {e}")
+            # Close out a partially streamed C1 message so the frontend doesn't
+            # leave it in a streaming state next to the fallback
+            if c1_stream_open:
+                await self._send_to_frontend(create_chat_done(id=enhanced_message_id))
             # Send fallback simple response
             await self._send_simple_response(
                 "Failed to generate enhanced visualization", thread_id, "text_chat"
@@ -403,20 +420,7 @@ class PerConnectionProcessor:
                 response_content = ensure_html_wrapped(response_content, framework)
             else:
                 # For C1 providers (TheSys, Tomorrow), use C1Component format
-                simple_card = {
-                    "component": {
-                        "component": "Card",
-                        "props": {
-                            "children": [{
-                                "component": "TextContent",
-                                "props": {
-                                    "textMarkdown": content
-                                }
-                            }]
-                        }
-                    }
-                }
-                response_content = f'<content>{json.dumps(simple_card)}</content>'
+                response_content = create_simple_card_content(content)
             
             # Determine framework for response
             framework = None
@@ -479,15 +483,7 @@ class PerConnectionProcessor:
                 error_content = ensure_html_wrapped(error_content, framework)
             else:
                 # For C1 providers (TheSys, Tomorrow), use C1Component format
-                error_card = {
-                    "component": "Callout",
-                    "props": {
-                        "variant": "error",
-                        "title": "Processing Error",
-                        "description": f"Failed to process your message: {error_message}"
-                    }
-                }
-                error_content = f'<content>{json.dumps(error_card)}</content>'
+                error_content = create_error_callout_content(f"Failed to process your message: {error_message}")
             
             # Determine framework for error response
             framework = None
@@ -8,7 +8,7 @@ slow path (enhancement pipeline) components of the Ada system.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, TypedDict, List, Union
+from typing import Dict, Any, Optional, Tuple, TypedDict, List, Union
 import json
 import uuid
 from dataclasses import dataclass, asdict
@@ -147,7 +147,8 @@ async def enqueue_llm_message(message: Union[
     
     try:
         await llm_message_queue.put(message)
-        logger.debug(f"Enqueued message to llm_message_queue: {message.get('type')} with ID {message.get('id')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Enqueued message to llm_message_queue: {message.get('type')} with ID {message.get('id')}")
     except Exception as e:
         logger.error(f"Error enqueuing message to llm_message_queue: {e}")
         raise
@@ -174,7 +175,8 @@ async def broadcast_voice_message(message: Union[
     """
     try:
         delivery_count = await voice_broadcast_manager.broadcast(message)
-        logger.debug(f"Broadcasted voice message {message.get('type')} to {delivery_count} subscribers")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Broadcasted voice message {message.get('type')} to {delivery_count} subscribers")
         return delivery_count
     except Exception as e:
         logger.error(f"Error broadcasting voice message: {e}")
@@ -198,7 +200,8 @@ async def get_llm_message():
     
     try:
         message = await llm_message_queue.get()
-        logger.debug(f"Got message from llm_message_queue: {message.get('type')} with ID {message.get('id')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Got message from llm_message_queue: {message.get('type')} with ID {message.get('id')}")
         return message
     except Exception as e:
         logger.error(f"Error getting message from llm_message_queue: {e}")
@@ -338,8 +341,50 @@ def create_text_chat_response(
     }
 
 # --------------------------------------------------------------------------- #
-# Helper for building a plain Card/TextContent payload
+# Helpers for building plain Card/TextContent and error Callout payloads
 # --------------------------------------------------------------------------- #
+def _split_c1_template(template: Dict[str, Any], sentinel: str) -> Tuple[str, str]:
+    """
+    Serialize a C1 payload template once and split it around its only variable field.
+
+    Args:
+        template: Payload with `sentinel` in place of the variable string
+        sentinel: Placeholder value marking where the variable string goes
+
+    Returns:
+        (prefix, suffix) such that prefix + json.dumps(value) + suffix equals
+        `<content>{json.dumps(payload)}</content>` for the filled-in payload.
+    """
+    prefix, suffix = f"<content>{json.dumps(template)}</content>".split(json.dumps(sentinel))
+    return prefix, suffix
+
+_C1_SENTINEL = "\x00c1-field\x00"
+
+_SIMPLE_CARD_PREFIX, _SIMPLE_CARD_SUFFIX = _split_c1_template({
+    "component": {
+        "component": "Card",
+        "props": {
+            "children": [
+                {
+                    "component": "TextContent",
+                    "props": {
+                        "textMarkdown": _C1_SENTINEL
+                    },
+                }
+            ]
+        },
+    }
+}, _C1_SENTINEL)
+
+_ERROR_CALLOUT_PREFIX, _ERROR_CALLOUT_SUFFIX = _split_c1_template({
+    "component": "Callout",
+    "props": {
+        "variant": "error",
+        "title": "Processing Error",
+        "description": _C1_SENTINEL
+    }
+}, _C1_SENTINEL)
+
 def create_simple_card_content(text_markdown: str) -> str:
     """
     Create the minimal C1-compatible payload used when no visual enhancement
@@ -347,28 +392,49 @@ def create_simple_card_content(text_markdown: str) -> str:
     `vis_processor.py` so that the UI receives consistent markup whether the
     payload is produced eagerly (fast-path) or later (slow-path).
 
+    The static part of the payload is serialized once at import; only the text
+    itself is JSON-escaped per call.
+
     Args:
         text_markdown: The raw assistant text to embed in the card.
 
     Returns:
         A `<content> … </content>` string ready to be placed in a message.
     """
-    simple_card = {
-        "component": {
-            "component": "Card",
-            "props": {
-                "children": [
-                    {
-                        "component": "TextContent",
-                        "props": {
-                            "textMarkdown": text_markdown
-                        },
-                    }
-                ]
-            },
-        }
-    }
-    return f"<content>{json.dumps(simple_card)}</content>"
+    return f"{_SIMPLE_CARD_PREFIX}{json.dumps(text_markdown)}{_SIMPLE_CARD_SUFFIX}"
+
+def extract_simple_card_text(content: str) -> Optional[str]:
+    """
+    Recover the text from a payload built by `create_simple_card_content`.
+
+    Only the JSON string between the precomputed prefix and suffix is decoded,
+    instead of parsing and walking the whole component tree.
+
+    Args:
+        content: A `<content> … </content>` payload.
+
+    Returns:
+        The embedded markdown text, or None if `content` is not a simple card.
+    """
+    if not (content.startswith(_SIMPLE_CARD_PREFIX) and content.endswith(_SIMPLE_CARD_SUFFIX)):
+        return None
+    try:
+        text = json.loads(content[len(_SIMPLE_CARD_PREFIX):len(content) - len(_SIMPLE_CARD_SUFFIX)])
+    except ValueError:
+        return None
+    return text if isinstance(text, str) else None
+
+def create_error_callout_content(description: str) -> str:
+    """
+    Create the C1 error Callout payload shown when processing a message fails.
+
+    Args:
+        description: Error description displayed in the callout.
+
+    Returns:
+        A `<content> … </content>` string ready to be placed in a message.
+    """
+    return f"{_ERROR_CALLOUT_PREFIX}{json.dumps(description)}{_ERROR_CALLOUT_SUFFIX}"
 
 # --------------------------------------------------------------------------- #
 # Helper for immediate voice responses
@@ -20,6 +20,9 @@ from app.models import (
 )
 from app.connection_manager import connection_manager
 from app.chat_history_manager import chat_history_manager
+from app.queues import extract_simple_card_text
+from app.voice_broadcast_manager import VoiceEnvelope
+from utils.json_utils import dumps as json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,14 @@ logger = logging.getLogger(__name__)
 interaction_dedup_cache: Dict[str, Dict[str, float]] = {}
 DEDUP_WINDOW_SECONDS = 5.0  # Time window to consider interactions as duplicates
 
+# C1 payload wrapper produced by create_simple_card_content
+C1_CONTENT_OPEN = "<content>"
+C1_CONTENT_CLOSE = "</content>"
+_C1_CONTENT_SLICE = slice(len(C1_CONTENT_OPEN), -len(C1_CONTENT_CLOSE))
+
+# Seconds a single WebSocket send may block before the client is treated as stalled
+WEBSOCKET_SEND_TIMEOUT = 5.0
+
 # Router for per-connection chat endpoints
 router = APIRouter(tags=["per-connection-chat"])
 
@@ -243,12 +254,30 @@ async def _per_connection_sender(context):
                 timeout=1.0
             )
             
-            logger.info(f"Per-connection sender {context.connection_id}: got message from queue: {message.get('type', 'unknown')} with ID {message.get('id', 'no-id')}")
-            
             # Send to WebSocket
-            serialized = message if isinstance(message, str) else json.dumps(message)
-            await context.websocket.send_text(serialized)
-            logger.info(f"Per-connection sender {context.connection_id}: sent message to WebSocket: {message.get('type', 'unknown')}")
+            if isinstance(message, VoiceEnvelope):
+                # Voice broadcasts arrive encoded once for all subscribers
+                serialized = message.payload or json_dumps(message.message)
+                message = message.message
+            elif isinstance(message, str):
+                serialized = message
+            else:
+                serialized = json_dumps(message)
+            try:
+                await asyncio.wait_for(context.websocket.send_text(serialized), timeout=WEBSOCKET_SEND_TIMEOUT)
+            except asyncio.TimeoutError:
+                # The client stopped reading; close rather than let its queue back up
+                logger.warning(f"WebSocket send to {context.connection_id} stalled for "
+                               f"{WEBSOCKET_SEND_TIMEOUT}s, closing slow client")
+                try:
+                    await context.websocket.close(code=1013)
+                except Exception:
+                    pass
+                break
+            # Per-message trace; skip formatting entirely unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG) and isinstance(message, dict):
+                logger.debug(f"Per-connection sender {context.connection_id}: sent {message.get('type', 'unknown')} "
+                             f"with ID {message.get('id', 'no-id')} to WebSocket")
             
             # Mark task as done
             context.message_queue.task_done()
@@ -256,7 +285,6 @@ async def _per_connection_sender(context):
             
         except asyncio.TimeoutError:
             # No message available, continue
-            logger.debug(f"Per-connection sender {context.connection_id}: timeout waiting for messages")
             continue
         except Exception as e:
             logger.error(f"Sender error for {context.connection_id}: {e}")
@@ -270,13 +298,15 @@ async def _per_connection_receiver(context):
         try:
             # Receive message from WebSocket
             data = await context.websocket.receive_text()
-            logger.info(f"Received message: {data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Received message: {data}")
             context.last_activity = asyncio.get_event_loop().time()
             
             # Parse message
             try:
                 payload = json.loads(data)
-                logger.info(f"Payload: {payload}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Payload: {payload}")
                 
                 # Determine message type and parse accordingly
                 message_type = payload.get('type', '')
@@ -322,14 +352,15 @@ async def _per_connection_voice_bridge(context):
         while context.state in [ConnectionState.ACTIVE, ConnectionState.READY]:
             try:
                 # Get message from broadcast subscription queue
-                logger.debug(f"Voice bridge {context.connection_id}: waiting for broadcast message...")
-                message = await asyncio.wait_for(voice_queue.get(), timeout=1.0)
-                logger.info(f"Voice bridge {context.connection_id}: received broadcast message type '{message.get('type')}' with ID {message.get('id')}")
+                envelope = await asyncio.wait_for(voice_queue.get(), timeout=1.0)
+                message = envelope.message
                 
                 try:
-                    # Forward to per-connection queue
-                    await context.message_queue.put(message)
-                    logger.info(f"✅ Successfully queued voice message {message.get('type')} to per-connection queue for {context.connection_id}")
+                    # Forward to per-connection queue; the sender unwraps the envelope
+                    await context.message_queue.put(envelope)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Voice bridge {context.connection_id}: queued {message.get('type')} "
+                                     f"with ID {message.get('id')}")
                     
                     # If this is an immediate_voice_response, also queue for enhancement processing
                     if message.get('type') == 'immediate_voice_response':
@@ -346,18 +377,24 @@ async def _per_connection_voice_bridge(context):
                             if thread_id:
                                 conversation_history = await chat_history_manager.get_recent_history(thread_id)
                             
-                            # Queue for enhancement processing
-                            await context.raw_output_queue.put({
-                                "assistant_response": assistant_response,
-                                "history": conversation_history,
-                                "metadata": {
-                                    "connection_id": context.connection_id,
-                                    "thread_id": thread_id,
-                                    "message_id": message.get('id'),  # This is the immediate_voice_response ID
-                                    "source": "voice-agent"
-                                }
-                            })
-                            logger.info(f"✅ Queued voice response for enhancement processing: {assistant_response[:50]}...")
+                            # Queue for enhancement processing without blocking the bridge. When the
+                            # queue is full the new voice job is dropped rather than evicting queued
+                            # work, which may include user chat jobs sharing this queue
+                            try:
+                                context.raw_output_queue.put_nowait({
+                                    "assistant_response": assistant_response,
+                                    "history": conversation_history,
+                                    "metadata": {
+                                        "connection_id": context.connection_id,
+                                        "thread_id": thread_id,
+                                        "message_id": message.get('id'),  # This is the immediate_voice_response ID
+                                        "source": "voice-agent"
+                                    }
+                                })
+                                logger.info(f"✅ Queued voice response for enhancement processing: {assistant_response[:50]}...")
+                            except asyncio.QueueFull:
+                                logger.warning(f"Enhancement queue full for connection {context.connection_id} "
+                                               f"(maxsize={context.raw_output_queue.maxsize}), dropping voice enhancement job")
                             
                         except Exception as e:
                             logger.error(f"Error queuing voice response for enhancement: {e}")
@@ -372,7 +409,6 @@ async def _per_connection_voice_bridge(context):
                 
             except asyncio.TimeoutError:
                 # No message available, continue
-                logger.debug(f"Voice bridge {context.connection_id}: timeout waiting for broadcast messages")
                 continue
             except Exception as e:
                 logger.error(f"Voice bridge error for {context.connection_id}: {e}")
@@ -642,10 +678,16 @@ def _convert_interaction_to_chat(interaction_type: str, context: Dict[str, Any])
 def _extract_text_from_voice_content(content: str) -> str:
     """Extract the raw text from a voice response C1 content payload"""
     try:
+        # Fast path: payloads built by create_simple_card_content only need their
+        # text field decoded
+        text = extract_simple_card_text(content)
+        if text is not None:
+            return text
+        
         # Voice responses use create_simple_card_content which wraps text in <content>{json}</content>
-        if content.startswith("<content>") and content.endswith("</content>"):
+        if content.startswith(C1_CONTENT_OPEN) and content.endswith(C1_CONTENT_CLOSE):
             # Extract JSON between tags
-            json_str = content[9:-10]  # Remove <content> and </content>
+            json_str = content[_C1_CONTENT_SLICE]
             data = json.loads(json_str)
             
             # Navigate the C1 structure to get textMarkdown
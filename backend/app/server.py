@@ -21,8 +21,7 @@ from typing import Dict, List, Any, Optional
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
-from openai import AsyncOpenAI
+from fastapi.responses import RedirectResponse, ORJSONResponse
 
 # Import configuration
 from app.config import config
@@ -34,10 +33,14 @@ from app.queues import initialize_queues
 # from app.routes.chat import router as chat_router, ws_router
 from app.routes.chat import router as per_connection_router
 from app.webrtc import router as webrtc_router, close_all_connections, get_prebuilt_ui
+from app.viz_provider_factory import VisualizationProviderFactory
 
 # Import MCP client
 from agent.enhanced_mcp_client_agent import EnhancedMCPClient
 
+# Shared OpenAI clients / HTTP transport
+from utils.openai_clients import get_async_openai_client, close_openai_clients
+
 # Import chat history manager (shared across the whole backend)
 from app.chat_history_manager import chat_history_manager
 logger = logging.getLogger(__name__)
@@ -68,12 +71,15 @@ async def lifespan(app: FastAPI):
     # Initialize queues
     initialize_queues()
     
+    # Preload visualization provider system prompts so requests never hit disk
+    VisualizationProviderFactory.preload_prompts()
+    
     # Initialize Thesys Client if API key is available
     if config.api.thesys_api_key:
         try:
             logger.info("Initializing Thesys Client...")
-            thesys_client = AsyncOpenAI(
-                api_key=config.api.thesys_api_key,
+            thesys_client = get_async_openai_client(
+                config.api.thesys_api_key,
                 base_url=config.thesys.thesys_base_url,
             )
             app.state.thesys_client = thesys_client
@@ -121,6 +127,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed cleaning up chat history threads: {e}", exc_info=True)
 
+    # Close the shared OpenAI HTTP connection pool
+    try:
+        await close_openai_clients()
+    except Exception as e:
+        logger.error(f"Failed to close OpenAI HTTP client: {e}", exc_info=True)
+
 def create_application() -> FastAPI:
     """
     Create and configure the FastAPI application
@@ -133,7 +145,8 @@ def create_application() -> FastAPI:
         title="Ada Interaction Engine",
         description="A dual-path voice and chat interaction system with dynamic UI generation",
         version="0.1.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
     
     # Add CORS middleware
@@ -151,10 +164,11 @@ def create_application() -> FastAPI:
     app.include_router(per_connection_router)
     app.include_router(webrtc_router)
     
-    # Mount prebuilt UI if available
-    prebuilt_ui = get_prebuilt_ui()
-    if prebuilt_ui:
-        app.mount("/prebuilt", prebuilt_ui)
+    # Mount prebuilt UI only when enabled; importing it loads the bundled frontend
+    if config.webrtc.enable_prebuilt_ui:
+        prebuilt_ui = get_prebuilt_ui()
+        if prebuilt_ui:
+            app.mount("/prebuilt", prebuilt_ui)
     
     # Add health check endpoint
     @app.get("/health", tags=["health"])
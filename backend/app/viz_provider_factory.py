@@ -18,12 +18,16 @@ from app.models import VisualizationProviderConfig
 from app.config import config
 from schemas import HTMLResponse
 from utils.prompt_manager import get_html_generator_prompt, load_prompt
+from utils.openai_clients import get_async_openai_client
 
 logger = logging.getLogger(__name__)
 
 class VisualizationProvider(ABC):
     """Abstract base class for visualization providers"""
     
+    # System prompt cached by VisualizationProviderFactory.preload_prompts()
+    _cached_system_prompt: Optional[str] = None
+    
     def __init__(self, config: VisualizationProviderConfig):
         self.config = config
         self.provider_type = config.provider_type
@@ -67,10 +71,7 @@ class ThesysProvider(VisualizationProvider):
                 
             base_url = self.config.base_url or "https://api.thesys.dev/v1/visualize"
             
-            self.client = AsyncOpenAI(
-                api_key=api_key,
-                base_url=base_url
-            )
+            self.client = get_async_openai_client(api_key, base_url)
             
             logger.info("Thesys provider initialized successfully")
             return True
@@ -105,6 +106,8 @@ class ThesysProvider(VisualizationProvider):
     
     def get_system_prompt(self) -> str:
         """Get Thesys system prompt"""
+        if self._cached_system_prompt is not None:
+            return self._cached_system_prompt
         try:
             from utils.thesys_prompts import load_thesys_prompt
             return load_thesys_prompt("visualization_system_prompt")
@@ -115,7 +118,7 @@ class ThesysProvider(VisualizationProvider):
     async def cleanup(self):
         """Clean up Thesys client"""
         if self.client:
-            # AsyncOpenAI doesn't require explicit cleanup
+            # The client is shared across connections, so only drop our reference
             self.client = None
 
 class GoogleProvider(VisualizationProvider):
@@ -173,6 +176,8 @@ class GoogleProvider(VisualizationProvider):
     
     def get_system_prompt(self) -> str:
         """Get Google-specific system prompt"""
+        if self._cached_system_prompt is not None:
+            return self._cached_system_prompt
         return load_prompt("google_ai_system")
     
     async def cleanup(self):
@@ -228,6 +233,8 @@ class TomorrowProvider(VisualizationProvider):
     
     def get_system_prompt(self) -> str:
         """Get Tomorrow-specific system prompt"""
+        if self._cached_system_prompt is not None:
+            return self._cached_system_prompt
         return load_prompt("tomorrow_ai_system")
     
     async def cleanup(self):
@@ -238,6 +245,9 @@ class TomorrowProvider(VisualizationProvider):
 class OpenAIProvider(VisualizationProvider):
     """OpenAI visualization provider (fallback)"""
     
+    # Frameworks whose HTML generator prompts are warmed at startup
+    PRELOAD_FRAMEWORKS = ("inline", "tailwind", "shadcn")
+    
     def __init__(self, config: VisualizationProviderConfig):
         super().__init__(config)
         self.client: Optional[AsyncOpenAI] = None
@@ -252,7 +262,7 @@ class OpenAIProvider(VisualizationProvider):
                 logger.warning(f"OpenAI API key not found in {api_key_env}")
                 return False
                 
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = get_async_openai_client(api_key)
             logger.info("OpenAI provider initialized successfully")
             return True
             
@@ -362,6 +372,30 @@ class VisualizationProviderFactory:
             logger.error(f"Error creating {config.provider_type} provider: {e}")
             return None
     
+    @classmethod
+    def preload_prompts(cls):
+        """
+        Load every registered provider's system prompt into memory.
+        
+        Called once during application startup so that visualization requests
+        never read prompt files from disk on the event loop.
+        """
+        for provider_type, provider_class in cls._providers.items():
+            try:
+                provider = provider_class(VisualizationProviderConfig(provider_type=provider_type))
+                
+                if isinstance(provider, OpenAIProvider):
+                    # Framework-specific prompts are cached by the prompt manager
+                    for framework in provider.PRELOAD_FRAMEWORKS:
+                        provider.get_system_prompt(framework)
+                else:
+                    provider_class._cached_system_prompt = provider.get_system_prompt()
+                
+                logger.info(f"Preloaded system prompt for {provider_type} provider")
+                
+            except Exception as e:
+                logger.error(f"Failed to preload system prompt for {provider_type} provider: {e}")
+    
     @classmethod
     def get_available_providers(cls) -> List[str]:
         """Get list of available provider types"""
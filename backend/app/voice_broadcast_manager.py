@@ -8,54 +8,161 @@ voice bridges compete for messages from a single queue.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Callable
+from collections import deque
+from itertools import chain
+from typing import Dict, Any, Optional, List, Callable, FrozenSet, NamedTuple
 from dataclasses import dataclass, field
 import time
 
+from utils.json_utils import dumps as _dumps
+
 logger = logging.getLogger(__name__)
 
 # Connection mapper import removed - no longer needed for ID translation
 
-@dataclass
+# Number of connection-ID shards; must be a power of two
+SUBSCRIBER_SHARDS = 16
+
+# Only voice-related message types are distributed by the broadcast manager
+VOICE_MESSAGE_TYPES = frozenset({
+    'user_transcription',       # User voice transcriptions
+    'immediate_voice_response', # Fast-path voice responses
+    'voice_response'            # Complete voice responses
+})
+
+class VoiceEnvelope(NamedTuple):
+    """
+    A broadcast voice message paired with its JSON encoding.
+    
+    The payload is encoded once per broadcast and shared by every subscriber, so
+    WebSocket senders need not re-encode it. The producer's dict is never modified.
+    """
+    message: dict
+    payload: Optional[str]
+
+class VoiceMessageBuffer:
+    """
+    Bounded FIFO of voice message envelopes for a single subscriber.
+    
+    Backed by a ``collections.deque`` and ``asyncio.Event`` wakeups, so delivering
+    a message never allocates a Future. Exposes the subset of the ``asyncio.Queue``
+    API that voice bridges rely on.
+    """
+    
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._messages: deque = deque(maxlen=maxsize)
+        self._notify = asyncio.Event()
+        self._space = asyncio.Event()
+        # Producers blocked in put(); non-blocking puts must not overtake them
+        self._putters = 0
+    
+    def put_nowait(self, message: VoiceEnvelope) -> None:
+        """Append a message, raising asyncio.QueueFull if the buffer is at capacity."""
+        if self._putters or len(self._messages) >= self.maxsize:
+            raise asyncio.QueueFull
+        self._messages.append(message)
+        self._notify.set()
+    
+    async def put(self, message: VoiceEnvelope) -> None:
+        """Wait until the buffer has room, then append the message."""
+        self._putters += 1
+        try:
+            while len(self._messages) >= self.maxsize:
+                self._space.clear()
+                await self._space.wait()
+        finally:
+            self._putters -= 1
+        self._messages.append(message)
+        self._notify.set()
+    
+    async def get(self) -> VoiceEnvelope:
+        """Wait for and return the oldest buffered message."""
+        while not self._messages:
+            self._notify.clear()
+            await self._notify.wait()
+        message = self._messages.popleft()
+        self._space.set()
+        return message
+    
+    def get_nowait(self) -> VoiceEnvelope:
+        """Return the oldest buffered message, raising asyncio.QueueEmpty if none."""
+        if not self._messages:
+            raise asyncio.QueueEmpty
+        message = self._messages.popleft()
+        self._space.set()
+        return message
+    
+    def task_done(self) -> None:
+        """No-op kept for asyncio.Queue compatibility."""
+    
+    def qsize(self) -> int:
+        """Number of buffered messages."""
+        return len(self._messages)
+    
+    def empty(self) -> bool:
+        """True if no messages are buffered."""
+        return not self._messages
+    
+    def full(self) -> bool:
+        """True if the buffer is at capacity."""
+        return len(self._messages) >= self.maxsize
+    
+    def clear(self) -> None:
+        """Drop all buffered messages."""
+        self._messages.clear()
+        self._space.set()
+
+@dataclass(eq=False)
 class VoiceSubscription:
     """Represents a voice message subscription for a connection"""
     connection_id: str
-    queue: asyncio.Queue
+    buffer: VoiceMessageBuffer
     voice_thread_id: Optional[str] = None
     created_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
     message_count: int = 0
 
+    _matches: Callable[[Optional[str], Optional[str]], bool] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Build the specialized matcher for the initial connection/thread IDs"""
+        self._rebuild_matcher()
+
+    def _rebuild_matcher(self) -> None:
+        """
+        Compile ID matching into a closure over this subscription's IDs.
+        
+        The closure takes a message's already-extracted connection and thread IDs;
+        callers check the message type first. Must be called again whenever
+        ``voice_thread_id`` changes.
+        """
+        connection_id = self.connection_id
+        voice_thread_id = self.voice_thread_id
+
+        def matches(message_connection_id: Optional[str], message_thread_id: Optional[str]) -> bool:
+            # Check for connection-specific markers
+            if message_connection_id and message_connection_id != connection_id:
+                return False
+            
+            # If this subscription has a voice thread, only match messages for that thread
+            if voice_thread_id and message_thread_id and message_thread_id != voice_thread_id:
+                return False
+            
+            return True
+
+        self._matches = matches
+
     def matches_message(self, message: dict) -> bool:
         """Check if this subscription should receive the given message"""
         if not isinstance(message, dict):
             return False
-        
-        message_type = message.get('type', '')
-        
-        # Only process voice-related message types
-        voice_message_types = {
-            'user_transcription',      # User voice transcriptions
-            'immediate_voice_response', # Fast-path voice responses
-            'voice_response'           # Complete voice responses
-        }
-        
-        if message_type not in voice_message_types:
-            return False
-        
-        # Check for connection-specific markers
-        message_connection_id = message.get('connection_id')
-        if message_connection_id and message_connection_id != self.connection_id:
+        if message.get('type', '') not in VOICE_MESSAGE_TYPES:
             return False
-        
-        # Check for thread-based matching
-        message_thread_id = message.get('threadId') or message.get('thread_id')
-        if message_thread_id:
-            # If this subscription has a voice thread, only match messages for that thread
-            if self.voice_thread_id and message_thread_id != self.voice_thread_id:
-                return False
-        
-        return True
+        return self._matches(
+            message.get('connection_id'),
+            message.get('threadId') or message.get('thread_id')
+        )
 
 class VoiceBroadcastManager:
     """
@@ -63,11 +170,30 @@ class VoiceBroadcastManager:
     
     This manager maintains a list of subscribers (voice bridges) and broadcasts
     voice messages to all relevant subscribers based on connection and thread filtering.
+    Subscribers are indexed by connection ID (``_shards``, sharded by hash) and by voice
+    thread ID (``_by_thread``) so targeted messages resolve without scanning every
+    subscriber.
+    
+    Both indexes are copy-on-write: mutators publish a new mapping instead of editing
+    the current one in place, so readers can capture a reference without locking.
+    Sharding keeps each copy small and lets a connection touch only its own shard.
+    Everything runs on a single event loop and no mutator awaits, so each swap is atomic.
     """
     
-    def __init__(self):
-        self._subscribers: Dict[str, VoiceSubscription] = {}
-        self._lock = asyncio.Lock()
+    def __init__(self, max_inflight: int = 64, backpressure_timeout: float = 0.5):
+        """
+        Args:
+            max_inflight: Maximum number of broadcasts that may concurrently wait
+                for a full subscriber buffer to drain
+            backpressure_timeout: Seconds to wait for a full buffer before dropping
+        """
+        self.max_inflight = max_inflight
+        self.backpressure_timeout = backpressure_timeout
+        # Created lazily so the semaphore binds to the running event loop
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._shards: List[Dict[str, VoiceSubscription]] = [{} for _ in range(SUBSCRIBER_SHARDS)]
+        # voice_thread_id -> subscriptions; subscriptions without a thread live under None
+        self._by_thread: Dict[Optional[str], FrozenSet[VoiceSubscription]] = {}
         self._stats = {
             'total_broadcasts': 0,
             'total_deliveries': 0,
@@ -80,35 +206,43 @@ class VoiceBroadcastManager:
         connection_id: str, 
         voice_thread_id: Optional[str] = None,
         queue_maxsize: int = 100
-    ) -> asyncio.Queue:
+    ) -> VoiceMessageBuffer:
         """
         Subscribe a connection to voice messages.
         
         Args:
             connection_id: WebSocket connection ID
             voice_thread_id: Optional thread ID for thread-specific filtering
-            queue_maxsize: Maximum size for the subscriber's queue
+            queue_maxsize: Maximum size for the subscriber's buffer
             
         Returns:
-            Queue that will receive voice messages for this connection
+            Buffer that will receive voice messages for this connection
         """
-        async with self._lock:
-            # Create new queue for this subscriber
-            queue = asyncio.Queue(maxsize=queue_maxsize)
-            
-            subscription = VoiceSubscription(
-                connection_id=connection_id,
-                queue=queue,
-                voice_thread_id=voice_thread_id
-            )
-            
-            self._subscribers[connection_id] = subscription
-            self._stats['active_subscribers'] = len(self._subscribers)
-            
-            logger.info(f"Voice broadcast subscription created for connection {connection_id} "
-                       f"with thread_id {voice_thread_id}")
-            
-            return queue
+        # Create new buffer for this subscriber
+        buffer = VoiceMessageBuffer(maxsize=queue_maxsize)
+        
+        subscription = VoiceSubscription(
+            connection_id=connection_id,
+            buffer=buffer,
+            voice_thread_id=voice_thread_id
+        )
+        
+        shard_index = self._shard_index(connection_id)
+        shard = dict(self._shards[shard_index])
+        previous = shard.get(connection_id)
+        if previous:
+            self._remove_from_thread_index(previous)
+        else:
+            self._stats['active_subscribers'] += 1
+        
+        shard[connection_id] = subscription
+        self._shards[shard_index] = shard
+        self._add_to_thread_index(subscription)
+        
+        logger.info(f"Voice broadcast subscription created for connection {connection_id} "
+                   f"with thread_id {voice_thread_id}")
+        
+        return buffer
     
     async def unsubscribe(self, connection_id: str) -> bool:
         """
@@ -120,24 +254,24 @@ class VoiceBroadcastManager:
         Returns:
             True if unsubscription successful, False if connection wasn't subscribed
         """
-        async with self._lock:
-            subscription = self._subscribers.pop(connection_id, None)
-            if subscription:
-                # Clear any remaining messages in the queue
-                while not subscription.queue.empty():
-                    try:
-                        subscription.queue.get_nowait()
-                        subscription.queue.task_done()
-                    except asyncio.QueueEmpty:
-                        break
-                
-                self._stats['active_subscribers'] = len(self._subscribers)
-                logger.info(f"Voice broadcast subscription removed for connection {connection_id} "
-                           f"(processed {subscription.message_count} messages)")
-                return True
+        shard_index = self._shard_index(connection_id)
+        subscription = self._shards[shard_index].get(connection_id)
+        if subscription:
+            shard = dict(self._shards[shard_index])
+            del shard[connection_id]
+            self._shards[shard_index] = shard
+            self._remove_from_thread_index(subscription)
             
-            logger.warning(f"Attempted to unsubscribe unknown connection: {connection_id}")
-            return False
+            # Drop any remaining messages in the buffer
+            subscription.buffer.clear()
+            
+            self._stats['active_subscribers'] -= 1
+            logger.info(f"Voice broadcast subscription removed for connection {connection_id} "
+                       f"(processed {subscription.message_count} messages)")
+            return True
+        
+        logger.warning(f"Attempted to unsubscribe unknown connection: {connection_id}")
+        return False
     
     async def update_thread_id(self, connection_id: str, voice_thread_id: str) -> bool:
         """
@@ -150,19 +284,53 @@ class VoiceBroadcastManager:
         Returns:
             True if update successful, False if connection not found
         """
-        async with self._lock:
-            subscription = self._subscribers.get(connection_id)
-            if subscription:
-                old_thread_id = subscription.voice_thread_id
-                subscription.voice_thread_id = voice_thread_id
-                subscription.last_activity = time.time()
-                
-                logger.info(f"Updated voice thread for connection {connection_id}: "
-                           f"{old_thread_id} -> {voice_thread_id}")
-                return True
+        subscription = self._get_subscription(connection_id)
+        if subscription:
+            old_thread_id = subscription.voice_thread_id
+            self._remove_from_thread_index(subscription)
+            subscription.voice_thread_id = voice_thread_id
+            subscription._rebuild_matcher()
+            self._add_to_thread_index(subscription)
+            subscription.last_activity = time.time()
             
-            logger.warning(f"Attempted to update thread for unknown connection: {connection_id}")
-            return False
+            logger.info(f"Updated voice thread for connection {connection_id}: "
+                       f"{old_thread_id} -> {voice_thread_id}")
+            return True
+        
+        logger.warning(f"Attempted to update thread for unknown connection: {connection_id}")
+        return False
+    
+    def _shard_index(self, connection_id: str) -> int:
+        """Map a connection ID to the index of its subscriber shard."""
+        return hash(connection_id) & (SUBSCRIBER_SHARDS - 1)
+    
+    def _get_subscription(self, connection_id: str) -> Optional[VoiceSubscription]:
+        """Look up a subscription in its shard."""
+        return self._shards[self._shard_index(connection_id)].get(connection_id)
+    
+    def _iter_subscriptions(self):
+        """Iterate over every subscription across all shards."""
+        # Shards are replaced, never mutated, so iterating one is safe without copying
+        for shard in self._shards:
+            yield from shard.values()
+    
+    def _add_to_thread_index(self, subscription: VoiceSubscription) -> None:
+        """Publish a new thread index that includes the subscription."""
+        thread_id = subscription.voice_thread_id
+        by_thread = dict(self._by_thread)
+        by_thread[thread_id] = by_thread.get(thread_id, frozenset()) | {subscription}
+        self._by_thread = by_thread
+    
+    def _remove_from_thread_index(self, subscription: VoiceSubscription) -> None:
+        """Publish a new thread index without the subscription."""
+        thread_id = subscription.voice_thread_id
+        by_thread = dict(self._by_thread)
+        bucket = by_thread.get(thread_id, frozenset()) - {subscription}
+        if bucket:
+            by_thread[thread_id] = bucket
+        else:
+            by_thread.pop(thread_id, None)
+        self._by_thread = by_thread
     
     # broadcast_from_rtc method removed - no longer needed
     # Voice agents now call broadcast() directly with the correct connection_id
@@ -181,87 +349,185 @@ class VoiceBroadcastManager:
             logger.warning(f"Invalid message type for broadcast: {type(message)}")
             return 0
         
+        # Extract routing fields once rather than per candidate subscriber
         message_type = message.get('type', 'unknown')
-        message_id = message.get('id', 'no-id')
         
-        async with self._lock:
-            subscribers = list(self._subscribers.values())
-        
-        if not subscribers:
-            logger.debug(f"No subscribers for voice message {message_type} (ID: {message_id})")
+        if message_type not in VOICE_MESSAGE_TYPES:
             return 0
         
-        delivery_tasks = []
-        matching_subscribers = []
+        connection_id = message.get('connection_id')
+        thread_id = message.get('threadId') or message.get('thread_id')
         
-        # Find matching subscribers
-        for subscription in subscribers:
-            if subscription.matches_message(message):
-                matching_subscribers.append(subscription)
-                delivery_tasks.append(self._deliver_message(subscription, message))
+        matching_subscribers = self._match_subscribers(connection_id, thread_id)
         
         if not matching_subscribers:
-            logger.debug(f"No matching subscribers for message {message_type} (ID: {message_id})")
             return 0
         
-        # Execute all deliveries concurrently
-        results = await asyncio.gather(*delivery_tasks, return_exceptions=True)
+        envelope = VoiceEnvelope(message, self._serialize(message))
         
-        # Count successful deliveries
+        # Deliver inline - put_nowait never suspends, so there is nothing to gather
+        now = time.time()
         successful_deliveries = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to deliver message to {matching_subscribers[i].connection_id}: {result}")
-                self._stats['failed_deliveries'] += 1
-            else:
+        backlogged = []
+        for subscription in matching_subscribers:
+            if self._deliver_message(subscription, envelope, now):
                 successful_deliveries += 1
-                self._stats['total_deliveries'] += 1
+            else:
+                backlogged.append(subscription)
         
+        if backlogged:
+            successful_deliveries += await self._deliver_with_backpressure(backlogged, envelope)
+        
+        self._stats['total_deliveries'] += successful_deliveries
         self._stats['total_broadcasts'] += 1
         
-        logger.info(f"✅ Broadcasted {message_type} (ID: {message_id}) to "
-                   f"{successful_deliveries}/{len(matching_subscribers)} subscribers")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Broadcasted {message_type} (ID: {message.get('id', 'no-id')}) to "
+                         f"{successful_deliveries}/{len(matching_subscribers)} subscribers")
         
         return successful_deliveries
     
-    async def _deliver_message(self, subscription: VoiceSubscription, message: dict) -> None:
+    def _match_subscribers(
+        self,
+        connection_id: Optional[str],
+        thread_id: Optional[str]
+    ) -> List[VoiceSubscription]:
         """
-        Deliver a message to a specific subscription.
+        Resolve the subscriptions a voice message should be delivered to.
+        
+        The caller is responsible for checking the message type.
         
         Args:
-            subscription: Target subscription
-            message: Message to deliver
+            connection_id: Connection the message targets, if any
+            thread_id: Voice thread the message belongs to, if any
+            
+        Returns:
+            List of matching subscriptions
         """
-        try:
-            # Try to put message without blocking (fail fast if queue is full)
-            subscription.queue.put_nowait(message)
-            subscription.message_count += 1
-            subscription.last_activity = time.time()
+        if not self._stats['active_subscribers']:
+            return []
+        
+        if connection_id:
+            # At most one subscriber can match a connection-targeted message, so
+            # check its shard directly instead of running the matchers
+            subscription = self._get_subscription(connection_id)
+            if subscription and (not thread_id or subscription.voice_thread_id in (None, thread_id)):
+                return [subscription]
+            return []
+        
+        # Resolve candidates through the thread index; only untargeted messages scan every shard
+        if thread_id:
+            # Capture the current snapshot; mutators swap in a new mapping
+            by_thread = self._by_thread
+            candidates = chain(by_thread.get(thread_id, ()), by_thread.get(None, ()))
+        else:
+            candidates = self._iter_subscriptions()
+        
+        return [
+            subscription for subscription in candidates
+            if subscription._matches(None, thread_id)
+        ]
+    
+    def _serialize(self, message: dict) -> Optional[str]:
+        """
+        Encode a message once for every subscriber that will receive it.
+        
+        Args:
+            message: Voice message about to be delivered
             
-            logger.debug(f"Delivered message {message.get('type')} to connection "
-                        f"{subscription.connection_id}")
+        Returns:
+            JSON text, or None to leave encoding to the WebSocket sender
+        """
+        try:
+            return _dumps(message)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Could not pre-serialize voice message {message.get('type')}: {e}")
+            return None
+    
+    def _deliver_message(self, subscription: VoiceSubscription, envelope: VoiceEnvelope, now: float) -> bool:
+        """
+        Deliver a message to a subscriber without waiting.
+        
+        Args:
+            subscription: Target subscription
+            envelope: Message and its encoded payload
+            now: Timestamp to record as the subscription's last activity
             
+        Returns:
+            True if delivered, False if the subscriber's buffer is full
+        """
+        try:
+            subscription.buffer.put_nowait(envelope)
         except asyncio.QueueFull:
-            logger.warning(f"Queue full for connection {subscription.connection_id}, "
-                          f"dropping message {message.get('type')}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error delivering message to {subscription.connection_id}: {e}")
-            raise
-    
-    async def get_subscriber_queue(self, connection_id: str) -> Optional[asyncio.Queue]:
+            return False
+        
+        subscription.message_count += 1
+        subscription.last_activity = now
+        return True
+    
+    async def _deliver_with_backpressure(
+        self,
+        subscriptions: List[VoiceSubscription],
+        envelope: VoiceEnvelope
+    ) -> int:
+        """
+        Wait for full subscriber buffers to drain instead of dropping immediately.
+        
+        All full buffers are waited on concurrently under a single
+        ``backpressure_timeout`` deadline, so a broadcast blocks for at most that
+        long no matter how many subscribers are backed up. The number of broadcasts
+        waiting here is capped by ``max_inflight``, so a burst of producers is
+        slowed down rather than piling up unbounded waiters.
+        
+        Args:
+            subscriptions: Subscriptions whose buffers were full
+            envelope: Message and its encoded payload
+        
+        Returns:
+            Number of subscriptions that received the message
         """
-        Get the queue for a specific subscriber.
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self.max_inflight)
+        
+        async with self._inflight:
+            puts = {
+                asyncio.ensure_future(subscription.buffer.put(envelope)): subscription
+                for subscription in subscriptions
+            }
+            _, pending = await asyncio.wait(puts, timeout=self.backpressure_timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Let cancelled puts unwind so none appends after we report a drop
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        delivered = 0
+        now = time.time()
+        for task, subscription in puts.items():
+            if task.cancelled() or task.exception() is not None:
+                logger.warning(f"Buffer full for connection {subscription.connection_id}, "
+                              f"dropping message {envelope.message.get('type')}")
+                self._stats['failed_deliveries'] += 1
+                continue
+            
+            subscription.message_count += 1
+            subscription.last_activity = now
+            delivered += 1
+        
+        return delivered
+    
+    async def get_subscriber_queue(self, connection_id: str) -> Optional[VoiceMessageBuffer]:
+        """
+        Get the message buffer for a specific subscriber.
         
         Args:
             connection_id: WebSocket connection ID
             
         Returns:
-            Queue for the subscriber or None if not found
+            Buffer for the subscriber or None if not found
         """
-        async with self._lock:
-            subscription = self._subscribers.get(connection_id)
-            return subscription.queue if subscription else None
+        subscription = self._get_subscription(connection_id)
+        return subscription.buffer if subscription else None
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -270,21 +536,20 @@ class VoiceBroadcastManager:
         Returns:
             Dictionary containing statistics
         """
-        async with self._lock:
-            stats = self._stats.copy()
-            stats['subscribers'] = []
-            
-            for subscription in self._subscribers.values():
-                stats['subscribers'].append({
-                    'connection_id': subscription.connection_id,
-                    'voice_thread_id': subscription.voice_thread_id,
-                    'created_at': subscription.created_at,
-                    'last_activity': subscription.last_activity,
-                    'message_count': subscription.message_count,
-                    'queue_size': subscription.queue.qsize()
-                })
-            
-            return stats
+        stats = self._stats.copy()
+        stats['subscribers'] = []
+        
+        for subscription in self._iter_subscriptions():
+            stats['subscribers'].append({
+                'connection_id': subscription.connection_id,
+                'voice_thread_id': subscription.voice_thread_id,
+                'created_at': subscription.created_at,
+                'last_activity': subscription.last_activity,
+                'message_count': subscription.message_count,
+                'queue_size': subscription.buffer.qsize()
+            })
+        
+        return stats
     
     async def cleanup_stale_subscriptions(self, max_idle_time: float = 3600.0) -> int:
         """
@@ -297,18 +562,35 @@ class VoiceBroadcastManager:
             Number of subscriptions cleaned up
         """
         current_time = time.time()
-        stale_connections = []
+        stale = [
+            subscription for subscription in self._iter_subscriptions()
+            if current_time - subscription.last_activity > max_idle_time
+        ]
         
-        async with self._lock:
-            for connection_id, subscription in self._subscribers.items():
-                if current_time - subscription.last_activity > max_idle_time:
-                    stale_connections.append(connection_id)
-        
-        cleanup_count = 0
-        for connection_id in stale_connections:
-            if await self.unsubscribe(connection_id):
-                cleanup_count += 1
+        if stale:
+            # Publish each affected index once instead of once per unsubscribe
+            shards = list(self._shards)
+            by_thread = dict(self._by_thread)
+            for subscription in stale:
+                shard_index = self._shard_index(subscription.connection_id)
+                if shards[shard_index] is self._shards[shard_index]:
+                    shards[shard_index] = dict(shards[shard_index])
+                del shards[shard_index][subscription.connection_id]
+                
+                thread_id = subscription.voice_thread_id
+                bucket = by_thread.get(thread_id, frozenset()) - {subscription}
+                if bucket:
+                    by_thread[thread_id] = bucket
+                else:
+                    by_thread.pop(thread_id, None)
+                
+                subscription.buffer.clear()
+            
+            self._shards[:] = shards
+            self._by_thread = by_thread
+            self._stats['active_subscribers'] -= len(stale)
         
+        cleanup_count = len(stale)
         if cleanup_count > 0:
             logger.info(f"Cleaned up {cleanup_count} stale voice subscriptions")
         
@@ -316,7 +598,7 @@ class VoiceBroadcastManager:
     
     def get_subscriber_count(self) -> int:
         """Get the current number of active subscribers."""
-        return len(self._subscribers)
+        return self._stats['active_subscribers']
 
 # Global broadcast manager instance
 voice_broadcast_manager = VoiceBroadcastManager()
\ No newline at end of file
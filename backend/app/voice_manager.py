@@ -21,6 +21,8 @@ class ConnectionAwareVoiceManager:
         self.connection_manager = connection_manager
         # Maintain a mapping from thread_id to connection_id for routing
         self.thread_to_connection_map: Dict[str, str] = {}
+        # Reverse of thread_to_connection_map so unregistering doesn't scan it
+        self.connection_to_thread_map: Dict[str, str] = {}
     
     async def register_voice_agent(self, connection_id: str, voice_agent: Any, webrtc_connection: Any, voice_thread_id: str) -> bool:
         """
@@ -41,7 +43,11 @@ class ConnectionAwareVoiceManager:
         
         if success:
             # Maintain thread-to-connection mapping for routing
+            previous_thread_id = self.connection_to_thread_map.get(connection_id)
+            if previous_thread_id and self.thread_to_connection_map.get(previous_thread_id) == connection_id:
+                del self.thread_to_connection_map[previous_thread_id]
             self.thread_to_connection_map[voice_thread_id] = connection_id
+            self.connection_to_thread_map[connection_id] = voice_thread_id
             logger.info(f"Voice agent registered for connection {connection_id} with thread {voice_thread_id}")
         else:
             logger.warning(f"Failed to register voice agent for connection {connection_id}")
@@ -59,13 +65,10 @@ class ConnectionAwareVoiceManager:
             True if unregistration successful, False otherwise
         """
         # Find and remove thread mapping first
-        thread_id_to_remove = None
-        for thread_id, conn_id in self.thread_to_connection_map.items():
-            if conn_id == connection_id:
-                thread_id_to_remove = thread_id
-                break
+        thread_id_to_remove = self.connection_to_thread_map.pop(connection_id, None)
         
-        if thread_id_to_remove:
+        # The thread may have been re-registered to another connection since
+        if thread_id_to_remove and self.thread_to_connection_map.get(thread_id_to_remove) == connection_id:
             del self.thread_to_connection_map[thread_id_to_remove]
             logger.info(f"Removed thread mapping {thread_id_to_remove} -> {connection_id}")
         
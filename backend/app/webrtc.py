@@ -8,7 +8,8 @@ fast path (speech-to-speech) processing pipeline.
 
 import logging
 import uuid
-from typing import Dict, List, Optional, Callable, Awaitable, Any
+import weakref
+from typing import List, Optional, Callable, Awaitable, Any, MutableMapping
 import asyncio
 
 from fastapi import APIRouter, BackgroundTasks, Request
@@ -32,11 +33,20 @@ logger = logging.getLogger(__name__)
 # Router for WebRTC endpoints
 router = APIRouter(prefix="/api", tags=["webrtc"])
 
-# Store connections by pc_id
-pcs_map: Dict[str, SmallWebRTCConnection] = {}
+# Store connections by pc_id. Entries are weak: the VoiceInterfaceAgent owns the
+# connection for the lifetime of its run task, so a connection whose close
+# handler never fires is still dropped once its agent goes away.
+pcs_map: MutableMapping[str, SmallWebRTCConnection] = weakref.WeakValueDictionary()
 
-# Create ICE servers from configuration
-ice_servers = [IceServer(urls=server["urls"]) for server in config.webrtc.ice_servers]
+# Maximum number of connections closed concurrently during shutdown
+MAX_CONCURRENT_CLOSES = 64
+
+# Seconds to wait for connections to close on shutdown before cancelling the rest
+SHUTDOWN_CLOSE_TIMEOUT = 5.0
+
+# Create ICE servers from configuration once; the immutable tuple is shared by
+# every SmallWebRTCConnection instead of rebuilding IceServer objects per offer
+ice_servers = tuple(IceServer(urls=server["urls"]) for server in config.webrtc.ice_servers)
 
 class WebRTCOffer(BaseModel):
     """WebRTC offer request model"""
@@ -107,15 +117,17 @@ async def handle_offer(request: WebRTCOffer, background_tasks: BackgroundTasks,
     """
     pc_id = request.pc_id
     
-    # Reuse existing connection if pc_id is provided and exists
-    if pc_id and pc_id in pcs_map:
-        pipecat_connection = pcs_map[pc_id]
+    # Reuse existing connection if pc_id is provided and exists. A single get() so a
+    # weak entry cannot disappear between a membership test and the lookup.
+    pipecat_connection = pcs_map.get(pc_id) if pc_id else None
+    if pipecat_connection is not None:
         logger.info(f"Reusing existing connection for pc_id: {pc_id}")
         await pipecat_connection.renegotiate(
             sdp=request.sdp, 
             type=request.type, 
             restart_pc=request.restart_pc
         )
+        answer = pipecat_connection.get_answer()
     else:
         # Create new connection with custom close handler for agent cleanup
         async def on_closed_with_agent_cleanup(webrtc_connection: SmallWebRTCConnection):
@@ -124,7 +136,7 @@ async def handle_offer(request: WebRTCOffer, background_tasks: BackgroundTasks,
             
             # Look for and unregister any associated agent
             # Note: This is a best-effort cleanup. The WeakSet will handle most cleanup automatically
-            for agent in list(getattr(webrtc_connection, '_associated_agents', [])):
+            for agent in list(getattr(webrtc_connection, '_associated_agents', ())):
                 try:
                     # Unregister from session manager
                     from app.session_manager import session_manager
@@ -195,10 +207,10 @@ async def handle_offer(request: WebRTCOffer, background_tasks: BackgroundTasks,
         else:
             logger.warning("No backend connection ID available, voice message routing may not work properly")
         
-        # Store reference for cleanup
+        # Store a weak reference for cleanup; the agent's run task keeps it alive
         if not hasattr(pipecat_connection, '_associated_agents'):
-            pipecat_connection._associated_agents = []
-        pipecat_connection._associated_agents.append(agent)
+            pipecat_connection._associated_agents = weakref.WeakSet()
+        pipecat_connection._associated_agents.add(agent)
         
         # Run the agent
         background_tasks.add_task(agent.run)
@@ -208,9 +220,6 @@ async def handle_offer(request: WebRTCOffer, background_tasks: BackgroundTasks,
         pc_id = answer["pc_id"]
         pcs_map[pc_id] = pipecat_connection
     
-    # Get the answer for the client
-    answer = pipecat_connection.get_answer()
-    
     return WebRTCAnswer(
         sdp=answer["sdp"],
         type=answer["type"],
@@ -220,9 +229,30 @@ async def handle_offer(request: WebRTCOffer, background_tasks: BackgroundTasks,
 async def close_all_connections():
     """Close all WebRTC connections"""
     logger.info(f"Closing {len(pcs_map)} WebRTC connections")
-    coros = [pc.close() for pc in pcs_map.values() if hasattr(pc, 'close')]
-    await asyncio.gather(*coros, return_exceptions=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLOSES)
+    
+    async def close_connection(pc: SmallWebRTCConnection):
+        async with semaphore:
+            try:
+                await pc.close()
+            except Exception as e:
+                logger.warning(f"Error closing WebRTC connection {getattr(pc, 'pc_id', '?')}: {e}")
+    
+    # Snapshot and clear first: closing fires on_closed handlers that remove entries
+    # from pcs_map, and /api/offer must not reuse a connection that is shutting down
+    connections = [pc for pc in list(pcs_map.values()) if hasattr(pc, 'close')]
     pcs_map.clear()
+    if connections:
+        tasks = {asyncio.create_task(close_connection(pc)): pc for pc in connections}
+        # A hung close must not stall shutdown (or a dev reload) indefinitely
+        _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_CLOSE_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        if pending:
+            pending_ids = [getattr(tasks[task], 'pc_id', '?') for task in pending]
+            logger.warning(f"Cancelled {len(pending)} WebRTC closes still pending after "
+                           f"{SHUTDOWN_CLOSE_TIMEOUT}s: {pending_ids}")
+            await asyncio.gather(*pending, return_exceptions=True)
     logger.info("All WebRTC connections closed")
 
 # Prebuilt UI mount point (optional)
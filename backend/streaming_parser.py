@@ -78,11 +78,13 @@ class EnhancementStreamingParser:
         # ------------------------------------------------------------------ #
         #  Verbose debug – token-level visibility of the incoming stream
         # ------------------------------------------------------------------ #
-        # Log the raw delta content (trim to first 120 chars to avoid noise)
-        logger.debug(
-            "StreamingParser ▸ raw_chunk: %s",
-            chunk.replace("\n", "\\n")[:120] + ("…" if len(chunk) > 120 else "")
-        )
+        # Log the raw delta content (trim to first 120 chars to avoid noise).
+        # Guarded so the escaped preview is not built per token when DEBUG is off.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "StreamingParser ▸ raw_chunk: %s",
+                chunk.replace("\n", "\\n")[:120] + ("…" if len(chunk) > 120 else "")
+            )
             
         self.buffer += chunk
         
@@ -106,13 +108,15 @@ class EnhancementStreamingParser:
                 len(voice_match), self.voice_disabled
             )
             words = voice_match.split()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             for word in words:
                 if word.strip():
                     # Inject each word immediately to TTS
                     if self.voice_injection_callback:
                         try:
                             await self.voice_injection_callback(word + " ")
-                            logger.debug(f"Injected voice word: '{word}'")
+                            if debug_enabled:
+                                logger.debug(f"Injected voice word: '{word}'")
                         except Exception as e:
                             logger.error(f"Error injecting voice word '{word}': {e}")
             
@@ -0,0 +1,90 @@
+"""
+Shared AsyncOpenAI clients, reused across connections instead of built per connection.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import DEFAULT_CONNECTION_LIMITS, AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Same request timeouts the OpenAI SDK uses by default
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# The SDK's own pool limits (1000 connections, 100 keepalive). Every cached client
+# draws from this one pool, and over HTTP/1.1 each streaming completion holds a
+# connection for the whole stream, so anything tighter would queue concurrent
+# voice sessions behind the pool instead of the API
+HTTP_LIMITS = DEFAULT_CONNECTION_LIMITS
+
+# One transport shared by every client below, so all endpoints and API keys
+# draw from a single connection pool
+_http_client: Optional[httpx.AsyncClient] = None
+
+# (api_key, base_url) -> client
+_clients: Dict[Tuple[str, Optional[str]], AsyncOpenAI] = {}
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide httpx client used as the OpenAI transport.
+
+    Returns:
+        Shared httpx.AsyncClient (HTTP/2 when `h2` is installed)
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            follow_redirects=True,
+        )
+        logger.info(f"Created shared OpenAI HTTP client (http2={HTTP2_AVAILABLE})")
+    return _http_client
+
+
+def get_async_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Get a process-wide AsyncOpenAI client for the given credentials.
+
+    Creating a client per connection throws away its HTTP connection pool (and the
+    TLS handshakes behind it) whenever the connection ends. Clients are cached by
+    API key and base URL, and all of them share one httpx transport.
+
+    Args:
+        api_key: API key for the client
+        base_url: Optional base URL override (e.g. for OpenAI-compatible APIs)
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        http_client = get_shared_http_client()
+        if base_url:
+            client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+        else:
+            client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        _clients[key] = client
+        logger.info(f"Created shared AsyncOpenAI client for {base_url or 'default endpoint'}")
+    return client
+
+
+async def close_openai_clients() -> None:
+    """Close the shared HTTP transport and forget cached clients (called on shutdown)."""
+    global _http_client
+    _clients.clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None